@@ -1,24 +1,110 @@
+from __future__ import annotations
+
+import argparse
 import asyncio
+import hashlib
 import json
 import logging
 import os
+import re
 import shutil
-from contextlib import AsyncExitStack
-from typing import Any, Dict, List
+import signal
+import time
+from contextlib import AsyncExitStack, contextmanager
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Tuple
 
-import httpx
 from dotenv import load_dotenv
-from mcp import ClientSession, StdioServerParameters
-from mcp.client.stdio import stdio_client
-from slack_bolt.adapter.socket_mode.async_handler import AsyncSocketModeHandler
-from slack_bolt.async_app import AsyncApp
-from slack_sdk.web.async_client import AsyncWebClient
+
+if TYPE_CHECKING:
+    from mcp import ClientSession
 
 # Configure logging
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
 )
 
+# Smallest reply size that leaves room for text between reopened code fences
+MIN_SLACK_MESSAGE_CHARS = 100
+
+class StartupProfiler:
+    """Records how long each startup phase takes.
+
+    Heavy SDKs are imported inside the phases that first need them, so their
+    import time shows up as its own phase. Run Python with ``-X importtime``
+    for a per-module breakdown.
+    """
+
+    def __init__(self, enabled: bool = False) -> None:
+        self.enabled = enabled
+        self.started_at = time.perf_counter()
+        self.phases: List[Tuple[str, float]] = []
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time a startup phase."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, time.perf_counter() - start))
+
+    def report(self) -> str:
+        """Format the phase breakdown.
+
+        Returns:
+            A human readable report.
+        """
+        lines = ["Startup profile", "  Phases:"]
+        for name, elapsed in self.phases:
+            lines.append(f"    {elapsed * 1000:8.1f} ms  {name}")
+        total = time.perf_counter() - self.started_at
+        lines.append(f"  Total: {total * 1000:.1f} ms")
+        return "\n".join(lines)
+
+
+class InFlightTracker:
+    """Counts in-flight operations so they can be drained before stopping."""
+
+    def __init__(self) -> None:
+        self.count: int = 0
+        self._idle: asyncio.Event = asyncio.Event()
+        self._idle.set()
+
+    def acquire(self) -> None:
+        """Mark an operation as in flight until release() is called."""
+        self.count += 1
+        self._idle.clear()
+
+    def release(self) -> None:
+        """Mark an operation started with acquire() as finished."""
+        self.count -= 1
+        if self.count == 0:
+            self._idle.set()
+
+    @contextmanager
+    def track(self) -> Iterator[None]:
+        """Mark an operation as in flight for the duration of the block."""
+        self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+    async def wait_idle(self, timeout: float | None = None) -> bool:
+        """Wait until no operations are in flight.
+
+        Args:
+            timeout: Maximum seconds to wait, or None to wait indefinitely.
+
+        Returns:
+            True if nothing is in flight, False if the timeout expired.
+        """
+        try:
+            await asyncio.wait_for(self._idle.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
 
 class Configuration:
     """Manages configuration and environment variables for the MCP Slackbot."""
@@ -32,6 +118,46 @@ class Configuration:
         self.groq_api_key = os.getenv("GROQ_API_KEY")
         self.anthropic_api_key = os.getenv("ANTHROPIC_API_KEY")
         self.llm_model = os.getenv("LLM_MODEL", "gpt-4-turbo")
+        # Cheaper/faster model for interpretation and short replies
+        self.llm_fast_model = os.getenv("LLM_FAST_MODEL", self.llm_model)
+        # Messages up to this many characters are routed to the fast model
+        # (0 disables the short reply route)
+        self.llm_short_reply_max_chars = int(
+            os.getenv("LLM_SHORT_REPLY_MAX_CHARS", "0"))
+        # Tool results longer than this are truncated before reaching the LLM
+        self.tool_result_preview_chars = int(
+            os.getenv("TOOL_RESULT_PREVIEW_CHARS", "4000"))
+        # Slack truncates long messages, so replies are split at this size
+        self.slack_message_max_chars = int(
+            os.getenv("SLACK_MESSAGE_MAX_CHARS", "3900"))
+        if self.slack_message_max_chars < MIN_SLACK_MESSAGE_CHARS:
+            raise ValueError(
+                f"SLACK_MESSAGE_MAX_CHARS must be at least "
+                f"{MIN_SLACK_MESSAGE_CHARS}"
+            )
+        # Tool manifests from the last run, used until servers are ready
+        self.tool_manifest_cache = os.getenv(
+            "TOOL_MANIFEST_CACHE",
+            os.path.join(os.path.dirname(__file__), ".tool_manifest_cache.json"),
+        )
+        # Seconds a tool call waits for its server to finish starting
+        self.server_ready_timeout = float(
+            os.getenv("SERVER_READY_TIMEOUT", "60"))
+        self.servers_config_path = os.getenv(
+            "SERVERS_CONFIG", "mcp_simple_slackbot/servers_config.json")
+        # Seconds between checks of the server config file (0 disables reload)
+        self.servers_config_reload_interval = float(
+            os.getenv("SERVERS_CONFIG_RELOAD_INTERVAL", "2"))
+        # Seconds to wait for in-flight tool calls before stopping a server
+        self.server_drain_timeout = float(
+            os.getenv("SERVER_DRAIN_TIMEOUT", "30"))
+        # Seconds to wait for active turns to finish when shutting down
+        self.shutdown_timeout = float(os.getenv("SHUTDOWN_TIMEOUT", "30"))
+        # Seconds to wait for MCP servers to stop after active turns drain
+        self.server_stop_timeout = float(os.getenv("SERVER_STOP_TIMEOUT", "10"))
+        # Local HTTP endpoint for liveness/readiness probes (port 0 disables)
+        self.health_host = os.getenv("HEALTH_HOST", "127.0.0.1")
+        self.health_port = int(os.getenv("HEALTH_PORT", "8080"))
 
     @staticmethod
     def load_env() -> None:
@@ -61,32 +187,64 @@ class Configuration:
         with open(file_path, "r") as f:
             return json.load(f)
 
-    @property
-    def llm_api_key(self) -> str:
-        """Get the appropriate LLM API key based on the model.
+    def route_settings(
+        self,
+        route: str,
+        default_model: str,
+        default_max_tokens: int,
+        default_temperature: float,
+    ) -> Dict[str, Any]:
+        """Get model settings for an LLM route.
+
+        Each value can be overridden with ``LLM_ROUTE_<ROUTE>_MODEL``,
+        ``LLM_ROUTE_<ROUTE>_MAX_TOKENS`` and ``LLM_ROUTE_<ROUTE>_TEMPERATURE``.
+
+        Args:
+            route: Name of the route (e.g. "planning").
+            default_model: Model used when no override is set.
+            default_max_tokens: Max tokens used when no override is set.
+            default_temperature: Temperature used when no override is set.
+
+        Returns:
+            Dict with model, max_tokens and temperature.
+        """
+        prefix = f"LLM_ROUTE_{route.upper()}_"
+        return {
+            "model": os.getenv(f"{prefix}MODEL", default_model),
+            "max_tokens": int(
+                os.getenv(f"{prefix}MAX_TOKENS", str(default_max_tokens))),
+            "temperature": float(
+                os.getenv(f"{prefix}TEMPERATURE", str(default_temperature))),
+        }
+
+    def api_key_for_model(self, model: str) -> str:
+        """Get the API key of the provider that serves a model.
+
+        This never falls back to another provider's key, so a misconfigured
+        route fails at startup instead of on every call.
+
+        Args:
+            model: Model identifier.
 
         Returns:
             The API key as a string.
 
         Raises:
-            ValueError: If no API key is found for the selected model.
+            ValueError: If the model is unsupported or its provider's API key
+                is not set.
         """
-        if "gpt" in self.llm_model.lower() and self.openai_api_key:
-            return self.openai_api_key
-        elif "llama" in self.llm_model.lower() and self.groq_api_key:
-            return self.groq_api_key
-        elif "claude" in self.llm_model.lower() and self.anthropic_api_key:
-            return self.anthropic_api_key
-
-        # Fallback to any available key
-        if self.openai_api_key:
-            return self.openai_api_key
-        elif self.groq_api_key:
-            return self.groq_api_key
-        elif self.anthropic_api_key:
-            return self.anthropic_api_key
+        if model.startswith("gpt-") or model.startswith("ft:gpt-"):
+            env_name, api_key = "OPENAI_API_KEY", self.openai_api_key
+        elif model.startswith("llama-"):
+            env_name, api_key = "GROQ_API_KEY", self.groq_api_key
+        elif model.startswith("claude-"):
+            env_name, api_key = "ANTHROPIC_API_KEY", self.anthropic_api_key
+        else:
+            raise ValueError(f"Unsupported model: {model}")
 
-        raise ValueError("No API key found for any LLM provider")
+        if not api_key:
+            raise ValueError(f"{env_name} must be set to use model {model}")
+        return api_key
 
 
 class Server:
@@ -99,9 +257,80 @@ class Server:
         self.session: ClientSession | None = None
         self._cleanup_lock: asyncio.Lock = asyncio.Lock()
         self.exit_stack: AsyncExitStack = AsyncExitStack()
+        self.ready: asyncio.Event = asyncio.Event()
+        self._stop_event: asyncio.Event = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self._calls: InFlightTracker = InFlightTracker()
+
+    @property
+    def config_hash(self) -> str:
+        """Stable hash of the server configuration."""
+        encoded = json.dumps(self.config, sort_keys=True).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()
+
+    def start(self) -> None:
+        """Start the server in a background task.
+
+        The connection is opened and closed inside the same task, as required
+        by the MCP stdio client. Use wait_ready() to wait for it and stop() to
+        shut it down.
+        """
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        try:
+            await self.initialize()
+        except asyncio.CancelledError:
+            # stop() gave up on a server that never finished starting
+            await self.cleanup()
+            raise
+        except Exception:
+            # initialize() already logged and cleaned up
+            return
+        finally:
+            self.ready.set()
+
+        # Close the session from this task even if it is cancelled
+        try:
+            await self._stop_event.wait()
+        finally:
+            await self.cleanup()
+
+    async def wait_ready(self, timeout: float | None = None) -> bool:
+        """Wait for the server to finish starting.
+
+        Args:
+            timeout: Maximum seconds to wait, or None to wait indefinitely.
+
+        Returns:
+            True if the server is initialized, False if it failed or timed out.
+        """
+        try:
+            await asyncio.wait_for(self.ready.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return self.session is not None
+
+    async def stop(self) -> None:
+        """Stop a server started with start().
+
+        A server that is still starting is cancelled, since initialize() may
+        never return (e.g. a hung ``npx`` download).
+        """
+        if self._task is None:
+            await self.cleanup()
+            return
+        if not self.ready.is_set():
+            self._task.cancel()
+        self._stop_event.set()
+        await asyncio.gather(self._task, return_exceptions=True)
 
     async def initialize(self) -> None:
         """Initialize the server connection."""
+        from mcp import ClientSession, StdioServerParameters
+        from mcp.client.stdio import stdio_client
+
         command = (
             shutil.which("npx")
             if self.config["command"] == "npx"
@@ -181,23 +410,36 @@ class Server:
         if not self.session:
             raise RuntimeError(f"Server {self.name} not initialized")
 
-        attempt = 0
-        while attempt < retries:
-            try:
-                logging.info(f"Executing {tool_name}...")
-                result = await self.session.call_tool(tool_name, arguments)
-                return result
-            except Exception as e:
-                attempt += 1
-                logging.warning(
-                    f"Error executing tool: {e}. Attempt {attempt} of {retries}."
-                )
-                if attempt < retries:
-                    logging.info(f"Retrying in {delay} seconds...")
-                    await asyncio.sleep(delay)
-                else:
-                    logging.error("Max retries reached. Failing.")
-                    raise
+        # Track in-flight calls so the server can be drained before stopping
+        with self._calls.track():
+            attempt = 0
+            while attempt < retries:
+                try:
+                    logging.info(f"Executing {tool_name}...")
+                    result = await self.session.call_tool(tool_name, arguments)
+                    return result
+                except Exception as e:
+                    attempt += 1
+                    logging.warning(
+                        f"Error executing tool: {e}. Attempt {attempt} of {retries}."
+                    )
+                    if attempt < retries:
+                        logging.info(f"Retrying in {delay} seconds...")
+                        await asyncio.sleep(delay)
+                    else:
+                        logging.error("Max retries reached. Failing.")
+                        raise
+
+    async def drain(self, timeout: float | None = None) -> bool:
+        """Wait for in-flight tool calls to finish.
+
+        Args:
+            timeout: Maximum seconds to wait, or None to wait indefinitely.
+
+        Returns:
+            True if no calls are in flight, False if the timeout expired.
+        """
+        return await self._calls.wait_idle(timeout)
 
     async def cleanup(self) -> None:
         """Clean up server resources."""
@@ -221,6 +463,19 @@ class Tool:
         self.description: str = description
         self.input_schema: Dict[str, Any] = input_schema
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the tool for the manifest cache."""
+        return {
+            "name": self.name,
+            "description": self.description,
+            "input_schema": self.input_schema,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Tool":
+        """Create a tool from a manifest cache entry."""
+        return cls(data["name"], data["description"], data["input_schema"])
+
     def format_for_llm(self) -> str:
         """Format tool information for LLM.
 
@@ -245,18 +500,190 @@ Arguments:
 """
 
 
+class ToolManifestCache:
+    """Caches each server's tool list on disk between runs."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._entries: Dict[str, Dict[str, Any]] | None = None
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if self._entries is None:
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    self._entries = json.load(f)
+            except FileNotFoundError:
+                self._entries = {}
+            except (OSError, json.JSONDecodeError) as e:
+                logging.warning(f"Ignoring unreadable tool cache {self.path}: {e}")
+                self._entries = {}
+        return self._entries
+
+    def get(self, server: Server) -> List[Tool] | None:
+        """Get cached tools for a server.
+
+        Args:
+            server: The server to look up.
+
+        Returns:
+            The cached tools, or None if there is no entry for the server's
+            current configuration.
+        """
+        entry = self._load().get(server.name)
+        if not entry or entry.get("config_hash") != server.config_hash:
+            return None
+        return [Tool.from_dict(tool) for tool in entry["tools"]]
+
+    def set(self, server: Server, tools: List[Tool]) -> None:
+        """Store a server's tools and write the cache to disk.
+
+        Args:
+            server: The server the tools belong to.
+            tools: The tools reported by the server.
+        """
+        entries = self._load()
+        entries[server.name] = {
+            "config_hash": server.config_hash,
+            "tools": [tool.to_dict() for tool in tools],
+        }
+        tmp_path = f"{self.path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(entries, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logging.warning(f"Error writing tool cache {self.path}: {e}")
+
+
+class ProcessedToolResult:
+    """Text extracted from a tool result with a bounded preview."""
+
+    def __init__(
+        self,
+        tool_name: str,
+        text: str,
+        preview: str,
+        is_error: bool = False,
+        truncated: bool = False,
+    ) -> None:
+        self.tool_name: str = tool_name
+        self.text: str = text
+        self.preview: str = preview
+        self.is_error: bool = is_error
+        self.truncated: bool = truncated
+
+    @property
+    def size_bytes(self) -> int:
+        """Size of the full result in UTF-8 bytes."""
+        return len(self.text.encode("utf-8"))
+
+
+class ToolResultProcessor:
+    """Extracts tool output and bounds what is passed to the LLM."""
+
+    ERROR_MARKER = "[The tool reported an error]"
+
+    def __init__(self, preview_chars: int = 4000) -> None:
+        """Initialize the processor.
+
+        Args:
+            preview_chars: Maximum characters of a result passed to the LLM
+        """
+        self.preview_chars = preview_chars
+
+    @staticmethod
+    def extract_text(result: Any) -> str:
+        """Extract readable text from an MCP tool result.
+
+        Args:
+            result: A CallToolResult or any other tool return value.
+
+        Returns:
+            The text content of the result.
+        """
+        content = getattr(result, "content", None)
+        if content is None:
+            if isinstance(result, (dict, list)):
+                return json.dumps(result, ensure_ascii=False, indent=2)
+            return str(result)
+
+        parts = []
+        for item in content:
+            text = getattr(item, "text", None)
+            if text is None:
+                resource = getattr(item, "resource", None)
+                text = getattr(resource, "text", None)
+            if text is not None:
+                parts.append(text)
+            else:
+                parts.append(f"[{getattr(item, 'type', 'unknown')} content]")
+
+        # Newer MCP SDKs use snake_case field names
+        structured = getattr(
+            result, "structuredContent", getattr(result, "structured_content", None)
+        )
+        if not parts and structured is not None:
+            return json.dumps(structured, ensure_ascii=False, indent=2)
+
+        return "\n".join(parts)
+
+    def process(self, tool_name: str, result: Any) -> ProcessedToolResult:
+        """Extract, measure and bound a tool result.
+
+        Args:
+            tool_name: Name of the tool that produced the result.
+            result: The raw tool result.
+
+        Returns:
+            The processed result. Its preview starts with ERROR_MARKER if the
+            tool reported an error.
+        """
+        text = self.extract_text(result)
+        is_error = bool(
+            getattr(result, "isError", getattr(result, "is_error", False)))
+        marker = f"{self.ERROR_MARKER}\n" if is_error else ""
+
+        if len(text) <= self.preview_chars:
+            return ProcessedToolResult(tool_name, text, marker + text, is_error)
+
+        processed = ProcessedToolResult(
+            tool_name,
+            text,
+            f"{marker}{text[: self.preview_chars]}\n\n"
+            f"... (truncated: showing {self.preview_chars} of {len(text)} "
+            f"characters)",
+            is_error,
+            truncated=True,
+        )
+        logging.info(
+            f"Tool {tool_name} returned {processed.size_bytes} bytes, "
+            f"truncated to {self.preview_chars} characters"
+        )
+        return processed
+
+
 class LLMClient:
     """Client for communicating with LLM APIs."""
 
-    def __init__(self, api_key: str, model: str) -> None:
+    def __init__(
+        self,
+        api_key: str,
+        model: str,
+        max_tokens: int = 1500,
+        temperature: float = 0.7,
+    ) -> None:
         """Initialize the LLM client.
 
         Args:
             api_key: API key for the LLM provider
             model: Model identifier to use
+            max_tokens: Maximum number of tokens to generate
+            temperature: Sampling temperature
         """
         self.api_key = api_key
         self.model = model
+        self.max_tokens = max_tokens
+        self.temperature = temperature
         self.timeout = 30.0  # 30 second timeout
         self.max_retries = 2
 
@@ -280,6 +707,8 @@ class LLMClient:
 
     async def _get_openai_response(self, messages: List[Dict[str, str]]) -> str:
         """Get a response from the OpenAI API."""
+        import httpx
+
         url = "https://api.openai.com/v1/chat/completions"
         headers = {
             "Authorization": f"Bearer {self.api_key}",
@@ -289,8 +718,8 @@ class LLMClient:
         payload = {
             "model": self.model,
             "messages": messages,
-            "temperature": 0.7,
-            "max_tokens": 1500,
+            "temperature": self.temperature,
+            "max_tokens": self.max_tokens,
         }
 
         for attempt in range(self.max_retries + 1):
@@ -315,6 +744,8 @@ class LLMClient:
 
     async def _get_groq_response(self, messages: List[Dict[str, str]]) -> str:
         """Get a response from the Groq API."""
+        import httpx
+
         url = "https://api.groq.com/openai/v1/chat/completions"
         headers = {
             "Authorization": f"Bearer {self.api_key}",
@@ -324,8 +755,8 @@ class LLMClient:
         payload = {
             "model": self.model,
             "messages": messages,
-            "temperature": 0.7,
-            "max_tokens": 1500,
+            "temperature": self.temperature,
+            "max_tokens": self.max_tokens,
         }
 
         for attempt in range(self.max_retries + 1):
@@ -350,6 +781,8 @@ class LLMClient:
 
     async def _get_anthropic_response(self, messages: List[Dict[str, str]]) -> str:
         """Get a response from the Anthropic API."""
+        import httpx
+
         url = "https://api.anthropic.com/v1/messages"
         headers = {
             "anthropic-version": "2023-06-01",
@@ -375,8 +808,8 @@ class LLMClient:
         payload = {
             "model": self.model,
             "messages": anthropic_messages,
-            "temperature": 0.7,
-            "max_tokens": 1500,
+            "temperature": self.temperature,
+            "max_tokens": self.max_tokens,
         }
 
         if system_message:
@@ -403,16 +836,169 @@ class LLMClient:
                 await asyncio.sleep(2**attempt)  # Exponential backoff
 
 
+class ModelRouter:
+    """Routes LLM requests to a model suited to the task.
+
+    Planning (the turn that decides whether to call a tool) goes to the main
+    model, while tool result interpretation and short replies go to a cheaper,
+    faster model.
+    """
+
+    PLANNING = "planning"
+    INTERPRETATION = "interpretation"
+    SHORT_REPLY = "short_reply"
+
+    def __init__(
+        self, clients: Dict[str, LLMClient], short_reply_max_chars: int = 0
+    ) -> None:
+        """Initialize the router.
+
+        Args:
+            clients: LLM client per route name
+            short_reply_max_chars: Messages up to this length use the short
+                reply route (0 disables it)
+        """
+        self.clients = clients
+        self.short_reply_max_chars = short_reply_max_chars
+        self.latency_stats: Dict[str, Dict[str, float]] = {
+            route: {"count": 0, "total": 0.0, "max": 0.0, "last": 0.0}
+            for route in clients
+        }
+
+    @classmethod
+    def from_config(cls, config: Configuration) -> "ModelRouter":
+        """Create a router from the configuration.
+
+        Args:
+            config: Bot configuration.
+
+        Returns:
+            A configured ModelRouter.
+
+        Raises:
+            ValueError: If a route's model has no API key for its provider.
+        """
+        defaults = {
+            cls.PLANNING: (config.llm_model, 1500, 0.7),
+            cls.INTERPRETATION: (config.llm_fast_model, 800, 0.3),
+            cls.SHORT_REPLY: (config.llm_fast_model, 500, 0.7),
+        }
+        clients = {}
+        for route, (model, max_tokens, temperature) in defaults.items():
+            settings = config.route_settings(
+                route, model, max_tokens, temperature)
+            try:
+                api_key = config.api_key_for_model(settings["model"])
+            except ValueError as e:
+                raise ValueError(f"LLM route {route}: {e}") from e
+            clients[route] = LLMClient(
+                api_key,
+                settings["model"],
+                max_tokens=settings["max_tokens"],
+                temperature=settings["temperature"],
+            )
+            logging.info(
+                f"LLM route {route}: {settings['model']} "
+                f"(max_tokens={settings['max_tokens']}, "
+                f"temperature={settings['temperature']})"
+            )
+        return cls(clients, config.llm_short_reply_max_chars)
+
+    def select_route(self, text: str) -> str:
+        """Pick the route for a user message.
+
+        Args:
+            text: The user's message
+
+        Returns:
+            The route name
+        """
+        if 0 < len(text.strip()) <= self.short_reply_max_chars:
+            return self.SHORT_REPLY
+        return self.PLANNING
+
+    async def get_response(
+        self, route: str, messages: List[Dict[str, str]]
+    ) -> str:
+        """Get a response from the LLM assigned to a route.
+
+        Args:
+            route: Route name
+            messages: List of conversation messages
+
+        Returns:
+            Text response from the LLM
+        """
+        client = self.clients.get(route, self.clients[self.PLANNING])
+        start = time.perf_counter()
+        try:
+            return await client.get_response(messages)
+        finally:
+            elapsed = time.perf_counter() - start
+            stats = self.latency_stats.setdefault(
+                route, {"count": 0, "total": 0.0, "max": 0.0, "last": 0.0}
+            )
+            stats["count"] += 1
+            stats["total"] += elapsed
+            stats["max"] = max(stats["max"], elapsed)
+            stats["last"] = elapsed
+            logging.info(
+                f"LLM route {route} ({client.model}) responded in {elapsed:.2f}s"
+            )
+
+    def latency_report(self) -> Dict[str, Dict[str, float]]:
+        """Summarize latency per route.
+
+        Returns:
+            Dict of route name to count, average, max and last latency in seconds
+        """
+        report = {}
+        for route, stats in self.latency_stats.items():
+            count = stats["count"]
+            report[route] = {
+                "count": count,
+                "avg": stats["total"] / count if count else 0.0,
+                "max": stats["max"],
+                "last": stats["last"],
+            }
+        return report
+
+
 class SlackMCPBot:
     """Manages the Slack bot integration with MCP servers."""
 
+    # Events counted as active turns from intake until their listener finishes
+    TRACKED_EVENTS = {"app_mention", "message"}
+    RESTART_MESSAGE = (
+        "I'm restarting and couldn't finish this request. "
+        "Please send it again in a moment."
+    )
+
     def __init__(
         self,
         slack_bot_token: str,
         slack_app_token: str,
         servers: List[Server],
-        llm_client: LLMClient,
+        llm_router: ModelRouter,
+        result_processor: ToolResultProcessor,
+        message_max_chars: int = 3900,
+        tool_cache: ToolManifestCache | None = None,
+        server_ready_timeout: float = 60.0,
+        server_drain_timeout: float = 30.0,
+        shutdown_timeout: float = 30.0,
+        server_stop_timeout: float = 10.0,
+        health_host: str = "127.0.0.1",
+        health_port: int = 0,
+        profiler: StartupProfiler | None = None,
     ) -> None:
+        self.profiler = profiler or StartupProfiler()
+        with self.profiler.phase("import Slack SDK"):
+            from slack_bolt.adapter.socket_mode.async_handler import (
+                AsyncSocketModeHandler,
+            )
+            from slack_bolt.async_app import AsyncApp
+            from slack_sdk.web.async_client import AsyncWebClient
+
         self.app = AsyncApp(token=slack_bot_token)
         # Create a socket mode handler with the app token
         self.socket_mode_handler = AsyncSocketModeHandler(
@@ -420,28 +1006,272 @@ class SlackMCPBot:
 
         self.client = AsyncWebClient(token=slack_bot_token)
         self.servers = servers
-        self.llm_client = llm_client
+        self.llm_router = llm_router
+        self.result_processor = result_processor
+        self.message_max_chars = message_max_chars
+        self.tool_cache = tool_cache
+        self.server_ready_timeout = server_ready_timeout
+        self.server_drain_timeout = server_drain_timeout
+        self.shutdown_timeout = shutdown_timeout
+        self.server_stop_timeout = server_stop_timeout
+        self.health_host = health_host
+        self.health_port = health_port
         self.conversations = {}  # Store conversation context per channel
-        self.tools = []
+        self.server_tools: Dict[str, List[Tool]] = {}  # Tools per server name
+        self.tools: List[Tool] = []
+        self.tool_servers: Dict[str, Server] = {}  # Server per tool name
+        self.servers_task: asyncio.Task | None = None
+        self._reload_lock = asyncio.Lock()
+        self._stop_watching = asyncio.Event()
+        self._watch_task: asyncio.Task | None = None
+        self.active_turns = InFlightTracker()
+        # Thread to notify per turn task if shutdown cuts the turn short
+        self._pending_replies: Dict[asyncio.Task, Tuple[str, str | None]] = {}
+        self.ready = False  # Connected to Slack and accepting events
+        self.shutting_down = False
+        self._health_runner: Any | None = None
 
         # Set up event handlers
+        # Runs after Bolt's built-in middleware, before the event is acked
+        self.app.middleware(self._track_intake)
         self.app.event("app_mention")(self.handle_mention)
-        self.app.message()(self.handle_message)
+        # Match every message subtype so each tracked event reaches a listener
+        self.app.event("message")(self.handle_message)
         self.app.event("app_home_opened")(self.handle_home_opened)
 
-    async def initialize_servers(self) -> None:
-        """Initialize all MCP servers and discover tools."""
+    def load_cached_tools(self) -> None:
+        """Load tool manifests from the last run.
+
+        This lets the bot build prompts before the servers have started.
+        """
+        if self.tool_cache is None:
+            return
         for server in self.servers:
+            tools = self.tool_cache.get(server)
+            if tools is not None:
+                self.server_tools[server.name] = tools
+        self._rebuild_tool_registry()
+        logging.info(f"Loaded {len(self.tools)} tools from the manifest cache")
+
+    async def initialize_servers(self) -> None:
+        """Initialize all MCP servers concurrently and discover tools."""
+        with self.profiler.phase("import MCP SDK"):
+            import mcp.client.stdio  # noqa: F401
+        with self.profiler.phase("initialize MCP servers"):
+            await asyncio.gather(
+                *(self._initialize_server(server) for server in self.servers)
+            )
+
+    async def _initialize_server(self, server: Server) -> None:
+        server_tools = await self._start_server(server)
+        if server_tools is None:
+            # Stop advertising cached tools that can't be called
+            self.server_tools.pop(server.name, None)
+        else:
+            self.server_tools[server.name] = server_tools
+        self._rebuild_tool_registry()
+
+    async def _start_server(self, server: Server) -> List[Tool] | None:
+        """Start a server and discover its tools.
+
+        Returns:
+            The server's tools, or None if it failed to start.
+        """
+        server.start()
+        try:
+            if not await server.wait_ready(self.server_ready_timeout):
+                raise RuntimeError(
+                    f"server did not start within {self.server_ready_timeout} "
+                    f"seconds"
+                )
+            server_tools = await server.list_tools()
+        except Exception as e:
+            logging.error(f"Failed to initialize server {server.name}: {e}")
+            await server.stop()
+            return None
+
+        if self.tool_cache is not None:
+            self.tool_cache.set(server, server_tools)
+        logging.info(
+            f"Initialized server {server.name} with {len(server_tools)} tools"
+        )
+        return server_tools
+
+    async def _retire_server(self, server: Server) -> None:
+        """Drain in-flight tool calls and stop a server."""
+        if not await server.drain(self.server_drain_timeout):
+            logging.warning(
+                f"Server {server.name} still had tool calls in flight after "
+                f"{self.server_drain_timeout} seconds"
+            )
+        try:
+            await server.stop()
+            logging.info(f"Server {server.name} stopped")
+        except Exception as e:
+            logging.error(f"Error stopping server {server.name}: {e}")
+
+    async def reload_servers(self, server_configs: Dict[str, Any]) -> None:
+        """Apply a new server configuration to the running bot.
+
+        Only added, removed or changed servers are started or stopped.
+        Replacements are started before the registry is swapped, and retired
+        servers finish their in-flight tool calls before they are stopped. A
+        changed server that fails to start keeps running with its old config.
+
+        Args:
+            server_configs: The "mcpServers" section of the config file.
+        """
+        async with self._reload_lock:
+            # Let the initial startup finish before diffing against it
+            if self.servers_task is not None:
+                await asyncio.gather(self.servers_task, return_exceptions=True)
+
+            current = {server.name: server for server in self.servers}
+            removed = [
+                server
+                for name, server in current.items()
+                if name not in server_configs
+            ]
+            started = [
+                Server(name, srv_config)
+                for name, srv_config in server_configs.items()
+                if name not in current or current[name].config != srv_config
+            ]
+            if not removed and not started:
+                return
+
+            logging.info(
+                f"Reloading servers: starting "
+                f"{[server.name for server in started]}, removing "
+                f"{[server.name for server in removed]}"
+            )
+
             try:
-                await server.initialize()
-                server_tools = await server.list_tools()
-                self.tools.extend(server_tools)
-                logging.info(
-                    f"Initialized server {server.name} with {len(server_tools)} tools"
+                results = await asyncio.gather(
+                    *(self._start_server(server) for server in started)
+                )
+            except asyncio.CancelledError:
+                # Shutdown only knows about registered servers, so stop the
+                # new ones here
+                await asyncio.gather(
+                    *(server.stop() for server in started), return_exceptions=True
                 )
+                raise
+
+            servers = [server for server in self.servers if server not in removed]
+            server_tools = {
+                name: tools
+                for name, tools in self.server_tools.items()
+                if name in server_configs
+            }
+            retired = list(removed)
+            for server, tools in zip(started, results):
+                if tools is None:
+                    # _start_server() already stopped it
+                    continue
+                old = current.get(server.name)
+                if old is not None:
+                    servers[servers.index(old)] = server
+                    retired.append(old)
+                else:
+                    servers.append(server)
+                server_tools[server.name] = tools
+
+            # Swap the registry so new tool calls go to the new servers
+            self.servers = servers
+            self.server_tools = server_tools
+            self._rebuild_tool_registry()
+
+            try:
+                await asyncio.gather(
+                    *(self._retire_server(server) for server in retired)
+                )
+            except asyncio.CancelledError:
+                # Retired servers are no longer registered either
+                await asyncio.gather(
+                    *(server.stop() for server in retired), return_exceptions=True
+                )
+                raise
+            logging.info(f"Server reload complete with {len(self.tools)} tools")
+
+    def start_config_watcher(
+        self,
+        path: str,
+        interval: float,
+        loaded_stat: Tuple[int, int] | None = None,
+    ) -> None:
+        """Reload servers whenever the config file changes.
+
+        Args:
+            path: Path to the server config file.
+            interval: Seconds between checks.
+            loaded_stat: config_stat() of the file taken when the running
+                config was loaded, so edits made during startup are applied.
+        """
+        if interval > 0 and self._watch_task is None:
+            self._watch_task = asyncio.create_task(
+                self._watch_config(path, interval, loaded_stat))
+
+    async def _watch_config(
+        self, path: str, interval: float, last_stat: Tuple[int, int] | None
+    ) -> None:
+        failed_stat = None
+        while not self._stop_watching.is_set():
+            try:
+                await asyncio.wait_for(self._stop_watching.wait(), interval)
+                break
+            except asyncio.TimeoutError:
+                pass
+
+            stat = self.config_stat(path)
+            if stat is None or stat == last_stat:
+                continue
+            try:
+                server_config = Configuration.load_config(path)
+                await self.reload_servers(server_config["mcpServers"])
+                last_stat = stat
             except Exception as e:
-                logging.error(
-                    f"Failed to initialize server {server.name}: {e}")
+                if stat == failed_stat:
+                    # Still invalid after a retry; wait for the next change
+                    logging.error(f"Error reloading server config {path}: {e}")
+                    last_stat = stat
+                else:
+                    # The file may be mid-write; retry on the next check
+                    logging.warning(
+                        f"Error reloading server config {path}, retrying: {e}"
+                    )
+                    failed_stat = stat
+
+    @staticmethod
+    def config_stat(path: str) -> Tuple[int, int] | None:
+        """Get the modification time and size of the config file.
+
+        Args:
+            path: Path to the server config file.
+
+        Returns:
+            A (mtime_ns, size) tuple, or None if the file can't be read.
+        """
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _rebuild_tool_registry(self) -> None:
+        """Replace the tool list and tool-to-server map in one step."""
+        servers_by_name = {server.name: server for server in self.servers}
+        tools = []
+        tool_servers = {}
+        for server_name, server_tools in self.server_tools.items():
+            server = servers_by_name.get(server_name)
+            if server is None:
+                continue
+            for tool in server_tools:
+                tools.append(tool)
+                tool_servers[tool.name] = server
+        self.tools = tools
+        self.tool_servers = tool_servers
 
     async def initialize_bot_info(self) -> None:
         """Get the bot's ID and other info."""
@@ -453,15 +1283,51 @@ class SlackMCPBot:
             logging.error(f"Failed to get bot info: {e}")
             self.bot_id = None
 
-    async def handle_mention(self, event, say):
+    async def _track_intake(self, body, context, next):
+        """Count a tracked event as an active turn before Slack gets the ack.
+
+        The listener releases the turn when it finishes, so a shutdown never
+        drops an event Slack already considers delivered.
+        """
+        if (
+            body.get("type") == "event_callback"
+            and body.get("event", {}).get("type") in self.TRACKED_EVENTS
+        ):
+            self.active_turns.acquire()
+            context["turn_tracked"] = True
+        return await next()
+
+    def _release_turn(self, context) -> None:
+        if context.pop("turn_tracked", False):
+            self.active_turns.release()
+
+    async def handle_mention(self, event, say, context):
         """Handle mentions of the bot in channels."""
-        await self._process_message(event, say)
+        try:
+            await self._run_turn(event, say)
+        finally:
+            self._release_turn(context)
 
-    async def handle_message(self, message, say):
+    async def handle_message(self, message, say, context):
         """Handle direct messages to the bot."""
-        # Only process direct messages
-        if message.get("channel_type") == "im" and not message.get("subtype"):
-            await self._process_message(message, say)
+        try:
+            # Only process direct messages
+            if message.get("channel_type") == "im" and not message.get("subtype"):
+                await self._run_turn(message, say)
+        finally:
+            self._release_turn(context)
+
+    async def _run_turn(self, event, say) -> None:
+        """Process a message, remembering its thread in case of shutdown."""
+        task = asyncio.current_task()
+        self._pending_replies[task] = (
+            event["channel"],
+            event.get("thread_ts", event.get("ts")),
+        )
+        try:
+            await self._process_message(event, say)
+        finally:
+            self._pending_replies.pop(task, None)
 
     async def handle_home_opened(self, event, client):
         """Handle when a user opens the App Home tab."""
@@ -578,11 +1444,14 @@ class SlackMCPBot:
                 messages.extend(self.conversations[channel]["messages"][-5:])
 
             # Get LLM response
-            response = await self.llm_client.get_response(messages)
+            route = self.llm_router.select_route(text)
+            response = await self.llm_router.get_response(route, messages)
 
             # Process tool calls in the response
             if "[TOOL]" in response:
-                response = await self._process_tool_call(response, channel)
+                response = await self._process_tool_call(
+                    response, channel, thread_ts
+                )
 
             # Add assistant response to conversation history
             self.conversations[channel]["messages"].append(
@@ -590,14 +1459,99 @@ class SlackMCPBot:
             )
 
             # Send the response to the user
-            await say(text=response, channel=channel, thread_ts=thread_ts)
+            await self._send_reply(say, response, channel, thread_ts)
 
         except Exception as e:
             error_message = f"I'm sorry, I encountered an error: {str(e)}"
             logging.error(f"Error processing message: {e}", exc_info=True)
             await say(text=error_message, channel=channel, thread_ts=thread_ts)
 
-    async def _process_tool_call(self, response: str, channel: str) -> str:
+    async def _send_reply(
+        self, say, text: str, channel: str, thread_ts: str | None
+    ) -> None:
+        """Send a reply, split into messages that fit Slack's size limit."""
+        for chunk in self._split_message(text, self.message_max_chars):
+            await say(text=chunk, channel=channel, thread_ts=thread_ts)
+
+    @staticmethod
+    def _split_message(text: str, max_chars: int) -> List[str]:
+        """Split text into chunks of at most max_chars characters.
+
+        Splits on paragraph or line boundaries where possible, and closes and
+        reopens code fences so each chunk renders on its own. A reopened fence
+        keeps the language of the original one (e.g. ```python).
+
+        Raises:
+            ValueError: If max_chars is below MIN_SLACK_MESSAGE_CHARS.
+        """
+        if max_chars < MIN_SLACK_MESSAGE_CHARS:
+            raise ValueError(
+                f"max_chars must be at least {MIN_SLACK_MESSAGE_CHARS}")
+        if len(text) <= max_chars:
+            return [text]
+
+        fence = "```"
+        chunks = []
+        remaining = text
+        open_fence = None  # Opening line of the fence left open, if any
+        while remaining:
+            prefix = f"{open_fence}\n" if open_fence else ""
+            # Leave room for a reopened and a closing fence
+            budget = max_chars - len(prefix) - len(fence) - 1
+            if len(remaining) <= budget:
+                chunks.append(prefix + remaining)
+                break
+
+            cut = remaining.rfind("\n\n", 0, budget)
+            if cut <= 0:
+                cut = remaining.rfind("\n", 0, budget)
+            if cut <= 0:
+                cut = budget
+                # Don't cut through a fence
+                start = remaining.find(
+                    fence, cut - len(fence) + 1, cut + len(fence) - 1)
+                if 0 < start < cut:
+                    cut = start
+
+            chunk = prefix + remaining[:cut].rstrip()
+            remaining = remaining[cut:].lstrip("\n")
+            # The chunk starts with any reopened fence, so rescan from closed
+            open_fence = None
+            for match in re.finditer(r"```[^`\n]*", chunk):
+                open_fence = None if open_fence else match.group(0)
+            if open_fence:
+                if len(open_fence) > max_chars // 4:
+                    # Drop an unusually long info string to leave room for text
+                    open_fence = fence
+                chunk += f"\n{fence}"
+            chunks.append(chunk)
+
+        return chunks
+
+    async def _upload_tool_result(
+        self, result: ProcessedToolResult, channel: str, thread_ts: str | None
+    ) -> bool:
+        """Upload the full text of a truncated tool result as a Slack file.
+
+        Returns:
+            True if the upload succeeded.
+        """
+        try:
+            await self.client.files_upload_v2(
+                channel=channel,
+                thread_ts=thread_ts,
+                content=result.text,
+                filename=f"{result.tool_name}-result.txt",
+                title=f"Full result of {result.tool_name}",
+            )
+            return True
+        except Exception as e:
+            logging.error(f"Error uploading result of {result.tool_name}: {e}")
+            return False
+
+    async def _process_tool_call(
+        self, response: str, channel: str, thread_ts: str | None = None
+    ) -> str:
         """Process a tool call from the LLM response."""
         try:
             # Extract tool name and arguments
@@ -623,58 +1577,74 @@ class SlackMCPBot:
                     f"the tool:\n\n{response.split('[TOOL]')[0]}"
                 )
 
-            # Find the appropriate server for this tool
-            for server in self.servers:
-                server_tools = [tool.name for tool in await server.list_tools()]
-                if tool_name in server_tools:
-                    # Execute the tool
-                    tool_result = await server.execute_tool(tool_name, arguments)
-
-                    # Add tool result to conversation history
-                    tool_result_msg = f"Tool result for {tool_name}:\n{tool_result}"
-                    self.conversations[channel]["messages"].append(
-                        {"role": "system", "content": tool_result_msg}
+            # Find the appropriate server for this tool, waiting for it to
+            # finish starting if needed
+            server = self.tool_servers.get(tool_name)
+            if server is not None and await server.wait_ready(
+                self.server_ready_timeout
+            ):
+                # Execute the tool
+                tool_result = await server.execute_tool(tool_name, arguments)
+                result = self.result_processor.process(tool_name, tool_result)
+
+                if result.truncated:
+                    uploaded = await self._upload_tool_result(
+                        result, channel, thread_ts
+                    )
+                    note = (
+                        "The full result has been shared with the user "
+                        "as a file.\n\n"
+                        if uploaded
+                        else "The full result was too large to show.\n\n"
                     )
+                else:
+                    note = ""
+
+                # Add tool result to conversation history
+                label = "Tool error" if result.is_error else "Tool result"
+                tool_result_msg = f"{label} for {tool_name}:\n{result.preview}"
+                self.conversations[channel]["messages"].append(
+                    {"role": "system", "content": tool_result_msg}
+                )
 
-                    try:
-                        # Get interpretation from LLM
-                        messages = [
-                            {
-                                "role": "system",
-                                "content": (
-                                    "You are a helpful assistant. You've just "
-                                    "used a tool and received results. Interpret "
-                                    "these results for the user in a clear, "
-                                    "helpful way."
-                                ),
-                            },
-                            {
-                                "role": "user",
-                                "content": (
-                                    f"I used the tool {tool_name} with arguments "
-                                    f"{args_text} and got this result:\n\n"
-                                    f"{tool_result}\n\n"
-                                    f"Please interpret this result for me."
-                                ),
-                            },
-                        ]
-
-                        interpretation = await self.llm_client.get_response(messages)
-                        return interpretation
-                    except Exception as e:
-                        logging.error(
-                            f"Error getting tool result interpretation: {e}",
-                            exc_info=True,
-                        )
-                        # Fallback to basic formatting
-                        if isinstance(tool_result, dict):
-                            result_text = json.dumps(tool_result, indent=2)
-                        else:
-                            result_text = str(tool_result)
-                        return (
-                            f"I used the {tool_name} tool and got these results:"
-                            f"\n\n```\n{result_text}\n```"
-                        )
+                try:
+                    # Get interpretation from LLM
+                    messages = [
+                        {
+                            "role": "system",
+                            "content": (
+                                "You are a helpful assistant. You've just "
+                                "used a tool and received results. Interpret "
+                                "these results for the user in a clear, "
+                                "helpful way."
+                            ),
+                        },
+                        {
+                            "role": "user",
+                            "content": (
+                                f"I used the tool {tool_name} with arguments "
+                                f"{args_text} and got this result:\n\n"
+                                f"{result.preview}\n\n"
+                                f"{note}"
+                                f"Please interpret this result for me."
+                            ),
+                        },
+                    ]
+
+                    interpretation = await self.llm_router.get_response(
+                        ModelRouter.INTERPRETATION, messages
+                    )
+                    return interpretation
+                except Exception as e:
+                    logging.error(
+                        f"Error getting tool result interpretation: {e}",
+                        exc_info=True,
+                    )
+                    # Fallback to basic formatting
+                    return (
+                        f"I used the {tool_name} tool and got these results:"
+                        f"\n\n```\n{result.preview}\n```"
+                    )
 
             # No server had the tool
             return (
@@ -690,16 +1660,148 @@ class SlackMCPBot:
             )
 
     async def start(self) -> None:
-        """Start the Slack bot."""
-        await self.initialize_servers()
-        await self.initialize_bot_info()
+        """Start the Slack bot.
+
+        Tools cached from the last run are advertised right away, and the MCP
+        servers start in the background while Socket Mode connects.
+        """
+        await self.start_health_server()
+        with self.profiler.phase("load cached tool manifests"):
+            self.load_cached_tools()
+        self.servers_task = asyncio.create_task(self.initialize_servers())
+        with self.profiler.phase("fetch bot info"):
+            await self.initialize_bot_info()
         # Start the socket mode handler
         logging.info("Starting Slack bot...")
-        asyncio.create_task(self.socket_mode_handler.start_async())
+        with self.profiler.phase("connect socket mode"):
+            await self.socket_mode_handler.connect_async()
+        self.ready = True
         logging.info("Slack bot started and waiting for messages")
 
+    async def start_health_server(self) -> None:
+        """Serve liveness (/healthz) and readiness (/readyz) probes."""
+        if not self.health_port or self._health_runner is not None:
+            return
+        from aiohttp import web
+
+        app = web.Application()
+        app.router.add_get("/healthz", self._handle_liveness)
+        app.router.add_get("/readyz", self._handle_readiness)
+        runner = web.AppRunner(app, access_log=None)
+        await runner.setup()
+        try:
+            await web.TCPSite(runner, self.health_host, self.health_port).start()
+        except OSError as e:
+            logging.error(f"Failed to start health endpoint: {e}")
+            await runner.cleanup()
+            return
+        self._health_runner = runner
+        logging.info(
+            f"Health endpoint listening on {self.health_host}:{self.health_port}"
+        )
+
+    async def _handle_liveness(self, request):
+        from aiohttp import web
+
+        return web.json_response({"status": "alive"})
+
+    async def _handle_readiness(self, request):
+        from aiohttp import web
+
+        connected = False
+        if self.ready and not self.shutting_down:
+            try:
+                connected = await self.socket_mode_handler.client.is_connected()
+            except Exception as e:
+                logging.warning(f"Error checking Socket Mode connection: {e}")
+        body = {
+            "status": "ready" if connected else "not ready",
+            "shutting_down": self.shutting_down,
+            "active_turns": self.active_turns.count,
+            "servers": {
+                server.name: server.session is not None for server in self.servers
+            },
+        }
+        return web.json_response(body, status=200 if connected else 503)
+
+    async def _abandon_turns(self) -> None:
+        """Cancel unfinished turns and ask their users to send them again."""
+        pending = list(self._pending_replies.items())
+        for task, _ in pending:
+            task.cancel()
+        await asyncio.gather(
+            *(
+                self._post_restart_notice(channel, thread_ts)
+                for _, (channel, thread_ts) in pending
+            )
+        )
+
+    async def _post_restart_notice(self, channel: str, thread_ts: str | None) -> None:
+        try:
+            await self.client.chat_postMessage(
+                channel=channel, thread_ts=thread_ts, text=self.RESTART_MESSAGE
+            )
+        except Exception as e:
+            logging.error(f"Error posting restart notice to {channel}: {e}")
+
+    async def _stop_servers(self) -> None:
+        """Stop the config watcher and all MCP servers.
+
+        The initial startup and any reload in progress are cancelled rather
+        than awaited, so a slow start can't use up the time meant for stopping
+        servers. A cancelled reload stops the servers it hasn't registered.
+        Each phase gets up to server_stop_timeout seconds.
+        """
+        # Stop waiting on servers that are still starting (stop() below
+        # cancels them) and abandon any reload in progress
+        tasks = [
+            task for task in (self.servers_task, self._watch_task) if task is not None
+        ]
+        for task in tasks:
+            task.cancel()
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(*tasks, return_exceptions=True),
+                self.server_stop_timeout,
+            )
+        except asyncio.TimeoutError:
+            logging.warning(
+                f"Config watcher did not stop within {self.server_stop_timeout} "
+                f"seconds"
+            )
+
+        # Clean up servers
+        servers = list(self.servers)
+        try:
+            results = await asyncio.wait_for(
+                asyncio.gather(
+                    *(server.stop() for server in servers), return_exceptions=True
+                ),
+                self.server_stop_timeout,
+            )
+        except asyncio.TimeoutError:
+            logging.warning(
+                f"MCP servers did not stop within {self.server_stop_timeout} "
+                f"seconds"
+            )
+            return
+        for server, result in zip(servers, results):
+            if isinstance(result, Exception):
+                logging.error(
+                    f"Error during cleanup of server {server.name}: {result}")
+            else:
+                logging.info(f"Server {server.name} cleaned up")
+
     async def cleanup(self) -> None:
-        """Clean up resources."""
+        """Shut down gracefully.
+
+        Intake stops first by closing the Socket Mode connection, so Slack
+        stops delivering events to this process. Turns already in progress get
+        up to shutdown_timeout seconds to finish; any still running after that
+        are cancelled and their threads are asked to retry. The MCP servers
+        are then stopped in parallel within server_stop_timeout seconds.
+        """
+        self.shutting_down = True
         try:
             if hasattr(self, "socket_mode_handler"):
                 await self.socket_mode_handler.close_async()
@@ -707,44 +1809,113 @@ class SlackMCPBot:
         except Exception as e:
             logging.error(f"Error closing socket mode handler: {e}")
 
-        # Clean up servers
-        for server in self.servers:
-            try:
-                await server.cleanup()
-                logging.info(f"Server {server.name} cleaned up")
-            except Exception as e:
-                logging.error(
-                    f"Error during cleanup of server {server.name}: {e}")
+        # Drain active turns
+        if self.active_turns.count:
+            logging.info(
+                f"Waiting up to {self.shutdown_timeout} seconds for "
+                f"{self.active_turns.count} active turns to finish"
+            )
+        if not await self.active_turns.wait_idle(self.shutdown_timeout):
+            logging.warning(
+                f"Shutdown timeout reached with {self.active_turns.count} "
+                f"turns still active"
+            )
+            await self._abandon_turns()
+
+        # A server stuck starting or stopping must not block exit
+        await self._stop_servers()
+
+        for route, stats in self.llm_router.latency_report().items():
+            if stats["count"]:
+                logging.info(
+                    f"LLM route {route}: {stats['count']} calls, "
+                    f"avg {stats['avg']:.2f}s, max {stats['max']:.2f}s"
+                )
 
+        if self._health_runner is not None:
+            await self._health_runner.cleanup()
+            self._health_runner = None
 
-async def main() -> None:
-    """Initialize and run the Slack bot."""
-    config = Configuration()
+
+async def main(profile_startup: bool = False) -> None:
+    """Initialize and run the Slack bot.
+
+    Args:
+        profile_startup: Print an import and startup phase breakdown once the
+            bot and all servers are ready.
+    """
+    profiler = StartupProfiler(enabled=profile_startup)
+    with profiler.phase("load configuration"):
+        config = Configuration()
 
     if not config.slack_bot_token or not config.slack_app_token:
         raise ValueError(
             "SLACK_BOT_TOKEN and SLACK_APP_TOKEN must be set in environment variables"
         )
 
-    server_config = config.load_config(
-        "mcp_simple_slackbot/servers_config.json")
+    # Stat before reading so an edit made during startup is picked up later
+    config_stat = SlackMCPBot.config_stat(config.servers_config_path)
+    server_config = config.load_config(config.servers_config_path)
     servers = [
         Server(name, srv_config)
         for name, srv_config in server_config["mcpServers"].items()
     ]
 
-    llm_client = LLMClient(config.llm_api_key, config.llm_model)
+    llm_router = ModelRouter.from_config(config)
+    result_processor = ToolResultProcessor(config.tool_result_preview_chars)
+
+    with profiler.phase("create Slack app"):
+        slack_bot = SlackMCPBot(
+            config.slack_bot_token,
+            config.slack_app_token,
+            servers,
+            llm_router,
+            result_processor,
+            config.slack_message_max_chars,
+            tool_cache=ToolManifestCache(config.tool_manifest_cache),
+            server_ready_timeout=config.server_ready_timeout,
+            server_drain_timeout=config.server_drain_timeout,
+            shutdown_timeout=config.shutdown_timeout,
+            server_stop_timeout=config.server_stop_timeout,
+            health_host=config.health_host,
+            health_port=config.health_port,
+            profiler=profiler,
+        )
 
-    slack_bot = SlackMCPBot(
-        config.slack_bot_token, config.slack_app_token, servers, llm_client
-    )
+    # Shut down gracefully on SIGTERM (e.g. systemctl stop) and SIGINT; a
+    # second signal exits immediately
+    stop_event = asyncio.Event()
+
+    def handle_signal(sig: signal.Signals) -> None:
+        if stop_event.is_set():
+            logging.warning(f"Received {sig.name} again, exiting immediately")
+            os._exit(128 + sig)
+        logging.info(
+            f"Received {sig.name}, shutting down (send again to force exit)")
+        stop_event.set()
+
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        try:
+            loop.add_signal_handler(sig, handle_signal, sig)
+        except NotImplementedError:
+            # Not supported on Windows; Ctrl+C raises KeyboardInterrupt instead
+            pass
 
     try:
         await slack_bot.start()
-        # Keep the main task alive until interrupted
-        while True:
-            await asyncio.sleep(1)
+        slack_bot.start_config_watcher(
+            config.servers_config_path,
+            config.servers_config_reload_interval,
+            config_stat,
+        )
+        if profiler.enabled:
+            await slack_bot.servers_task
+            print(profiler.report(), flush=True)
+        await stop_event.wait()
+        logging.info("Shutting down...")
     except KeyboardInterrupt:
+        # Only reached where signal handlers aren't supported (Windows)
         logging.info("Shutting down...")
     except Exception as e:
         logging.error(f"Error: {e}")
@@ -753,4 +1924,11 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    parser = argparse.ArgumentParser(description="MCP Slackbot")
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="print a startup phase breakdown, including SDK import time",
+    )
+    args = parser.parse_args()
+    asyncio.run(main(profile_startup=args.profile_startup))
@@ -45,4 +45,4 @@ $PYTHON_PATH -m pip install -r mcp_simple_slackbot/requirements.txt
 # スクリプトを実行
 echo "Starting the application..."
 cd "$SCRIPT_DIR"
-$PYTHON_PATH mcp_simple_slackbot/main.py 
+exec $PYTHON_PATH mcp_simple_slackbot/main.py "$@"
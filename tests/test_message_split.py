@@ -0,0 +1,66 @@
+import pytest
+
+from mcp_simple_slackbot.main import MIN_SLACK_MESSAGE_CHARS, SlackMCPBot
+
+split_message = SlackMCPBot._split_message
+
+
+def test_short_message_is_not_split():
+    assert split_message("hello", 100) == ["hello"]
+
+
+def test_chunks_fit_limit_and_keep_all_text():
+    text = "\n".join(f"line {i}" for i in range(200))
+    chunks = split_message(text, 100)
+    assert len(chunks) > 1
+    assert all(len(chunk) <= 100 for chunk in chunks)
+    assert "\n".join(chunks).split() == text.split()
+
+
+def test_prefers_paragraph_boundaries():
+    first = "a" * 60
+    second = "b" * 60
+    assert split_message(f"{first}\n\n{second}", 100) == [first, second]
+
+
+def test_hard_cuts_text_without_newlines():
+    chunks = split_message("a" * 250, 100)
+    assert all(len(chunk) <= 100 for chunk in chunks)
+    assert "".join(chunks) == "a" * 250
+
+
+def test_code_fences_are_rebalanced():
+    code = "\n".join(f"print({i})" for i in range(100))
+    text = f"intro\n\n```\n{code}\n```\noutro"
+    chunks = split_message(text, 120)
+    assert len(chunks) > 2
+    for chunk in chunks:
+        assert len(chunk) <= 120
+        assert chunk.count("```") % 2 == 0
+    assert chunks[1].startswith("```\n")
+
+
+@pytest.mark.parametrize("max_chars", [0, 4, MIN_SLACK_MESSAGE_CHARS - 1])
+def test_rejects_limits_too_small_to_make_progress(max_chars):
+    with pytest.raises(ValueError):
+        split_message("a" * 20, max_chars)
+
+
+def test_hard_cut_does_not_split_a_fence():
+    text = "a" * 95 + "```" + "b" * 150 + "```"
+    chunks = split_message(text, 100)
+    assert all(len(chunk) <= 100 for chunk in chunks)
+    assert chunks[0] == "a" * 95
+    for chunk in chunks:
+        assert chunk.count("```") % 2 == 0
+        assert "``" not in chunk.replace("```", "")
+
+
+def test_reopened_fence_keeps_its_language():
+    code = "\n".join(f"print({i})" for i in range(100))
+    chunks = split_message(f"```python\n{code}\n```", 120)
+    assert len(chunks) > 2
+    for chunk in chunks:
+        assert chunk.startswith("```python\n")
+        assert chunk.endswith("```")
+        assert len(chunk) <= 120
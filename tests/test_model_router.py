@@ -0,0 +1,124 @@
+import asyncio
+
+import pytest
+
+from mcp_simple_slackbot.main import Configuration, ModelRouter
+
+LLM_ENV_VARS = [
+    "OPENAI_API_KEY",
+    "GROQ_API_KEY",
+    "ANTHROPIC_API_KEY",
+    "LLM_MODEL",
+    "LLM_FAST_MODEL",
+    "LLM_SHORT_REPLY_MAX_CHARS",
+]
+
+
+@pytest.fixture(autouse=True)
+def clean_env(monkeypatch):
+    for name in LLM_ENV_VARS:
+        monkeypatch.delenv(name, raising=False)
+    for route in ("PLANNING", "INTERPRETATION", "SHORT_REPLY"):
+        for setting in ("MODEL", "MAX_TOKENS", "TEMPERATURE"):
+            monkeypatch.delenv(f"LLM_ROUTE_{route}_{setting}", raising=False)
+    # Keep a developer's .env from leaking into the tests
+    monkeypatch.setattr(Configuration, "load_env", staticmethod(lambda: None))
+
+
+class FakeClient:
+    def __init__(self, model, response="ok"):
+        self.model = model
+        self.response = response
+
+    async def get_response(self, messages):
+        await asyncio.sleep(0.01)
+        return self.response
+
+
+def test_from_config_uses_main_and_fast_models(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    monkeypatch.setenv("GROQ_API_KEY", "gsk-test")
+    monkeypatch.setenv("LLM_MODEL", "gpt-4o")
+    monkeypatch.setenv("LLM_FAST_MODEL", "llama-3.1-8b-instant")
+
+    router = ModelRouter.from_config(Configuration())
+
+    planning = router.clients[ModelRouter.PLANNING]
+    interpretation = router.clients[ModelRouter.INTERPRETATION]
+    assert (planning.model, planning.api_key) == ("gpt-4o", "sk-test")
+    assert (interpretation.model, interpretation.api_key) == (
+        "llama-3.1-8b-instant",
+        "gsk-test",
+    )
+    assert interpretation.max_tokens == 800
+    assert interpretation.temperature == 0.3
+
+
+def test_from_config_fails_without_route_provider_key(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    monkeypatch.setenv("LLM_MODEL", "gpt-4o")
+    monkeypatch.setenv("LLM_FAST_MODEL", "llama-3.1-8b-instant")
+
+    with pytest.raises(ValueError, match="interpretation.*GROQ_API_KEY"):
+        ModelRouter.from_config(Configuration())
+
+
+def test_route_overrides(monkeypatch):
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "sk-ant-test")
+    monkeypatch.setenv("LLM_MODEL", "claude-3-5-sonnet-latest")
+    monkeypatch.setenv("LLM_ROUTE_SHORT_REPLY_MODEL", "claude-3-5-haiku-latest")
+    monkeypatch.setenv("LLM_ROUTE_SHORT_REPLY_MAX_TOKENS", "200")
+    monkeypatch.setenv("LLM_ROUTE_SHORT_REPLY_TEMPERATURE", "0.1")
+
+    router = ModelRouter.from_config(Configuration())
+
+    short_reply = router.clients[ModelRouter.SHORT_REPLY]
+    assert short_reply.model == "claude-3-5-haiku-latest"
+    assert short_reply.max_tokens == 200
+    assert short_reply.temperature == 0.1
+    assert router.clients[ModelRouter.PLANNING].max_tokens == 1500
+
+
+def test_select_route_without_short_reply_threshold():
+    router = ModelRouter({ModelRouter.PLANNING: FakeClient("gpt-4o")})
+    assert router.select_route("hi") == ModelRouter.PLANNING
+
+
+def test_select_route_with_short_reply_threshold():
+    router = ModelRouter(
+        {ModelRouter.PLANNING: FakeClient("gpt-4o")}, short_reply_max_chars=5
+    )
+    assert router.select_route("hi") == ModelRouter.SHORT_REPLY
+    assert router.select_route("  hello  ") == ModelRouter.SHORT_REPLY
+    assert router.select_route("hello there") == ModelRouter.PLANNING
+    assert router.select_route("   ") == ModelRouter.PLANNING
+
+
+def test_get_response_records_latency_per_route():
+    router = ModelRouter(
+        {
+            ModelRouter.PLANNING: FakeClient("gpt-4o", "plan"),
+            ModelRouter.INTERPRETATION: FakeClient("llama-3.1-8b-instant", "done"),
+        }
+    )
+
+    async def run():
+        assert await router.get_response(ModelRouter.PLANNING, []) == "plan"
+        assert await router.get_response(ModelRouter.PLANNING, []) == "plan"
+        assert await router.get_response(ModelRouter.INTERPRETATION, []) == "done"
+
+    asyncio.run(run())
+    report = router.latency_report()
+
+    assert report[ModelRouter.PLANNING]["count"] == 2
+    assert report[ModelRouter.INTERPRETATION]["count"] == 1
+    planning = report[ModelRouter.PLANNING]
+    assert 0 < planning["avg"] <= planning["max"]
+    assert planning["last"] > 0
+
+
+def test_unknown_route_falls_back_to_planning():
+    router = ModelRouter({ModelRouter.PLANNING: FakeClient("gpt-4o", "plan")})
+
+    assert asyncio.run(router.get_response("classification", [])) == "plan"
+    assert router.latency_report()["classification"]["count"] == 1
@@ -0,0 +1,168 @@
+import asyncio
+import json
+
+import pytest
+
+from mcp_simple_slackbot import main
+from mcp_simple_slackbot.main import SlackMCPBot, Tool
+
+
+class FakeServer(main.Server):
+    """Server that starts instantly, or fails if its config sets "fail"."""
+
+    async def initialize(self) -> None:
+        if self.config.get("fail"):
+            raise RuntimeError("failed to start")
+        self.session = object()
+
+    async def list_tools(self):
+        version = self.config.get("version", 0)
+        return [Tool(f"{self.name}_v{version}", "test tool", {})]
+
+    async def cleanup(self) -> None:
+        self.session = None
+
+
+@pytest.fixture(autouse=True)
+def fake_servers(monkeypatch):
+    # reload_servers creates servers through the module-level Server class
+    monkeypatch.setattr(main, "Server", FakeServer)
+
+
+def run_with_bot(server_configs, test):
+    async def run():
+        servers = [FakeServer(name, config) for name, config in server_configs.items()]
+        bot = SlackMCPBot("xoxb-test", "xapp-test", servers, None, None)
+        try:
+            await bot.initialize_servers()
+            await test(bot)
+        finally:
+            await bot.socket_mode_handler.close_async()
+
+    asyncio.run(run())
+
+
+def test_reload_adds_and_removes_servers():
+    async def test(bot):
+        removed = bot.tool_servers["b_v0"]
+        await bot.reload_servers({"a": {}, "c": {}})
+
+        assert sorted(bot.tool_servers) == ["a_v0", "c_v0"]
+        assert [server.name for server in bot.servers] == ["a", "c"]
+        assert removed.session is None
+
+    run_with_bot({"a": {}, "b": {}}, test)
+
+
+def test_reload_restarts_only_changed_servers():
+    async def test(bot):
+        unchanged = bot.tool_servers["a_v0"]
+        old = bot.tool_servers["b_v0"]
+        await bot.reload_servers({"a": {}, "b": {"version": 1}})
+
+        assert sorted(bot.tool_servers) == ["a_v0", "b_v1"]
+        assert bot.tool_servers["a_v0"] is unchanged
+        assert unchanged.session is not None
+        assert bot.tool_servers["b_v1"] is not old
+        assert old.session is None
+
+    run_with_bot({"a": {}, "b": {}}, test)
+
+
+def test_changed_server_that_fails_to_start_keeps_running():
+    async def test(bot):
+        old = bot.tool_servers["a_v0"]
+        await bot.reload_servers({"a": {"fail": True}})
+
+        assert bot.servers == [old]
+        assert bot.tool_servers == {"a_v0": old}
+        assert old.session is not None
+
+    run_with_bot({"a": {}}, test)
+
+
+def test_added_server_that_fails_to_start_is_not_registered():
+    async def test(bot):
+        await bot.reload_servers({"a": {}, "b": {"fail": True}})
+
+        assert [server.name for server in bot.servers] == ["a"]
+        assert list(bot.tool_servers) == ["a_v0"]
+
+    run_with_bot({"a": {}}, test)
+
+
+def test_unchanged_config_is_a_no_op():
+    async def test(bot):
+        servers = list(bot.servers)
+        await bot.reload_servers({"a": {}})
+
+        assert bot.servers == servers
+
+    run_with_bot({"a": {}}, test)
+
+
+def test_retired_server_drains_in_flight_calls():
+    async def test(bot):
+        old = bot.tool_servers["a_v0"]
+        finished = asyncio.Event()
+
+        async def slow_call(tool_name, arguments):
+            await asyncio.sleep(0.1)
+            finished.set()
+            return "done"
+
+        old.session = type("Session", (), {"call_tool": staticmethod(slow_call)})()
+        call = asyncio.create_task(old.execute_tool("a_v0", {}))
+        await asyncio.sleep(0)
+        await bot.reload_servers({"a": {"version": 1}})
+
+        assert finished.is_set()
+        assert await call == "done"
+        assert old.session is None
+
+    run_with_bot({"a": {}}, test)
+
+
+def test_watcher_applies_changes_made_after_the_config_was_loaded(tmp_path):
+    path = tmp_path / "servers_config.json"
+    path.write_text(json.dumps({"mcpServers": {"a": {}}}))
+    loaded_stat = SlackMCPBot.config_stat(str(path))
+
+    async def test(bot):
+        # Edited while the bot was starting, before the watcher ran
+        path.write_text(json.dumps({"mcpServers": {"a": {}, "b": {}}}))
+        bot.start_config_watcher(str(path), 0.01, loaded_stat)
+        await asyncio.sleep(0.1)
+        bot._stop_watching.set()
+        await bot._watch_task
+
+        assert sorted(bot.tool_servers) == ["a_v0", "b_v0"]
+
+    run_with_bot({"a": {}}, test)
+
+
+def test_watcher_retries_invalid_config_once(tmp_path, monkeypatch):
+    path = tmp_path / "servers_config.json"
+    path.write_text("{not json")
+    loads = []
+    load_config = main.Configuration.load_config
+
+    def counting_load_config(file_path):
+        loads.append(file_path)
+        return load_config(file_path)
+
+    monkeypatch.setattr(main.Configuration, "load_config", counting_load_config)
+
+    async def test(bot):
+        bot.start_config_watcher(str(path), 0.01)
+        await asyncio.sleep(0.1)
+        assert len(loads) == 2
+
+        path.write_text(json.dumps({"mcpServers": {"b": {}}}))
+        await asyncio.sleep(0.1)
+        bot._stop_watching.set()
+        await bot._watch_task
+
+        assert list(bot.tool_servers) == ["b_v0"]
+
+    run_with_bot({"a": {}}, test)
@@ -0,0 +1,194 @@
+import asyncio
+import time
+
+from mcp_simple_slackbot import main
+from mcp_simple_slackbot.main import ModelRouter, SlackMCPBot
+
+
+class FakeClient:
+    def __init__(self):
+        self.posted = []
+
+    async def chat_postMessage(self, **kwargs):
+        self.posted.append(kwargs)
+
+
+class HungServer(main.Server):
+    """Server whose start never completes, like a stuck npx download."""
+
+    async def initialize(self) -> None:
+        await asyncio.sleep(3600)
+
+
+class ConfigServer(main.Server):
+    """Server that starts instantly unless its config sets "hang"."""
+
+    cleaned_up = []
+
+    async def initialize(self) -> None:
+        if self.config.get("hang"):
+            await asyncio.sleep(3600)
+        self.session = object()
+
+    async def cleanup(self) -> None:
+        self.cleaned_up.append(self.name)
+        self.session = None
+
+
+def make_bot(servers=(), **kwargs):
+    bot = SlackMCPBot(
+        "xoxb-test", "xapp-test", list(servers), ModelRouter({}), None, **kwargs
+    )
+    bot.client = FakeClient()
+    return bot
+
+
+def message_body(event_type="message", **event):
+    return {"type": "event_callback", "event": {"type": event_type, **event}}
+
+
+def test_event_counts_as_active_turn_from_intake():
+    async def run():
+        bot = make_bot()
+        context = {}
+        counted_before_ack = []
+
+        async def next():
+            counted_before_ack.append(bot.active_turns.count)
+
+        await bot._track_intake(message_body(), context, next)
+        assert counted_before_ack == [1]
+
+        # A channel message the bot ignores still releases its turn
+        await bot.handle_message({"channel": "C1", "ts": "1"}, None, context)
+        assert bot.active_turns.count == 0
+        await bot.cleanup()
+
+    asyncio.run(run())
+
+
+def test_untracked_events_are_not_counted():
+    async def run():
+        bot = make_bot()
+        context = {}
+
+        async def next():
+            pass
+
+        await bot._track_intake(message_body("app_home_opened"), context, next)
+        assert bot.active_turns.count == 0
+        assert "turn_tracked" not in context
+        await bot.cleanup()
+
+    asyncio.run(run())
+
+
+def test_shutdown_waits_for_active_turns():
+    async def run():
+        bot = make_bot(shutdown_timeout=5)
+        finished = []
+
+        async def process_message(event, say):
+            await asyncio.sleep(0.1)
+            finished.append(event["ts"])
+
+        bot._process_message = process_message
+        context = {}
+        await bot._track_intake(message_body(), context, _noop)
+        turn = asyncio.create_task(
+            bot.handle_mention({"channel": "C1", "ts": "1"}, None, context)
+        )
+        await bot.cleanup()
+
+        assert finished == ["1"]
+        assert bot.client.posted == []
+        await turn
+
+    asyncio.run(run())
+
+
+def test_turns_past_the_deadline_are_asked_to_retry():
+    async def run():
+        bot = make_bot(shutdown_timeout=0.05)
+
+        async def process_message(event, say):
+            await asyncio.sleep(3600)
+
+        bot._process_message = process_message
+        context = {}
+        await bot._track_intake(message_body(), context, _noop)
+        turn = asyncio.create_task(
+            bot.handle_mention(
+                {"channel": "C1", "ts": "2", "thread_ts": "1"}, None, context
+            )
+        )
+        await asyncio.sleep(0)
+        await bot.cleanup()
+
+        assert bot.client.posted == [
+            {"channel": "C1", "thread_ts": "1", "text": SlackMCPBot.RESTART_MESSAGE}
+        ]
+        await asyncio.gather(turn, return_exceptions=True)
+        assert turn.cancelled()
+        assert bot.active_turns.count == 0
+
+    asyncio.run(run())
+
+
+def test_hung_server_does_not_block_shutdown():
+    async def run():
+        server = HungServer("hung", {})
+        bot = make_bot([server], server_stop_timeout=1)
+        bot.servers_task = asyncio.create_task(bot.initialize_servers())
+        await asyncio.sleep(0.05)
+
+        start = time.monotonic()
+        await bot.cleanup()
+
+        assert time.monotonic() - start < 1
+        assert server._task.done()
+
+    asyncio.run(run())
+
+
+def test_reload_in_progress_does_not_block_shutdown(monkeypatch):
+    monkeypatch.setattr(main, "Server", ConfigServer)
+    monkeypatch.setattr(ConfigServer, "cleaned_up", [])
+
+    async def run():
+        server = ConfigServer("a", {})
+        bot = make_bot([server], server_stop_timeout=1)
+        await bot.initialize_servers()
+        # A watcher stuck starting a new server mid-reload
+        bot._watch_task = asyncio.create_task(
+            bot.reload_servers({"a": {}, "b": {"hang": True}})
+        )
+        await asyncio.sleep(0.05)
+
+        start = time.monotonic()
+        await bot.cleanup()
+
+        assert time.monotonic() - start < 1
+        assert sorted(ConfigServer.cleaned_up) == ["a", "b"]
+        assert server.session is None
+        assert bot._watch_task.cancelled()
+
+    asyncio.run(run())
+
+
+def test_cancelled_server_task_closes_its_session():
+    async def run():
+        server = ConfigServer("a", {})
+        server.start()
+        assert await server.wait_ready(1)
+
+        server._task.cancel()
+        await asyncio.gather(server._task, return_exceptions=True)
+
+        assert server.session is None
+
+    asyncio.run(run())
+
+
+async def _noop():
+    pass
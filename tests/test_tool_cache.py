@@ -0,0 +1,167 @@
+import asyncio
+import json
+
+from mcp_simple_slackbot.main import (
+    Server,
+    SlackMCPBot,
+    Tool,
+    ToolManifestCache,
+)
+
+
+class FakeServer(Server):
+    """Server that starts instantly, or fails if its config sets "fail"."""
+
+    async def initialize(self) -> None:
+        if self.config.get("fail"):
+            raise RuntimeError("failed to start")
+        self.session = object()
+
+    async def list_tools(self):
+        return [Tool(f"{self.name}_live", "live tool", {})]
+
+    async def cleanup(self) -> None:
+        self.session = None
+
+
+class HungServer(Server):
+    """Server whose start never completes, like a stuck npx download."""
+
+    cleaned_up = False
+
+    async def initialize(self) -> None:
+        await asyncio.sleep(3600)
+
+    async def cleanup(self) -> None:
+        self.cleaned_up = True
+
+
+def cached_tool(name):
+    return Tool(name, "cached tool", {"properties": {}})
+
+
+def test_cache_round_trip(tmp_path):
+    path = str(tmp_path / "cache.json")
+    server = Server("drive", {"command": "node", "args": ["drive.js"]})
+    ToolManifestCache(path).set(server, [cached_tool("search")])
+
+    tools = ToolManifestCache(path).get(server)
+
+    assert [tool.to_dict() for tool in tools] == [
+        cached_tool("search").to_dict()
+    ]
+
+
+def test_cache_misses_after_config_change(tmp_path):
+    path = str(tmp_path / "cache.json")
+    cache = ToolManifestCache(path)
+    cache.set(Server("drive", {"args": ["v1.js"]}), [cached_tool("search")])
+
+    assert cache.get(Server("drive", {"args": ["v2.js"]})) is None
+    assert cache.get(Server("sheets", {"args": ["v1.js"]})) is None
+
+
+def test_corrupt_cache_is_ignored(tmp_path):
+    path = tmp_path / "cache.json"
+    path.write_text("{not json")
+    server = Server("drive", {})
+    cache = ToolManifestCache(str(path))
+
+    assert cache.get(server) is None
+
+    # The next write replaces the corrupt file
+    cache.set(server, [cached_tool("search")])
+    assert json.loads(path.read_text())["drive"]["tools"][0]["name"] == "search"
+
+
+def test_unreadable_cache_is_ignored(tmp_path):
+    # A directory can't be opened as a file
+    cache = ToolManifestCache(str(tmp_path))
+
+    assert cache.get(Server("drive", {})) is None
+
+
+def test_cached_tools_are_advertised_until_the_server_starts(tmp_path):
+    path = str(tmp_path / "cache.json")
+    ToolManifestCache(path).set(FakeServer("a", {}), [cached_tool("a_cached")])
+
+    async def run():
+        bot = SlackMCPBot(
+            "xoxb-test",
+            "xapp-test",
+            [FakeServer("a", {})],
+            None,
+            None,
+            tool_cache=ToolManifestCache(path),
+        )
+        try:
+            bot.load_cached_tools()
+            assert list(bot.tool_servers) == ["a_cached"]
+
+            await bot.initialize_servers()
+            assert list(bot.tool_servers) == ["a_live"]
+        finally:
+            await bot.socket_mode_handler.close_async()
+
+    asyncio.run(run())
+    # The live tool list replaces the cached one for the next run
+    tools = ToolManifestCache(path).get(FakeServer("a", {}))
+    assert [tool.name for tool in tools] == ["a_live"]
+
+
+def test_cached_tools_are_dropped_when_the_server_fails(tmp_path):
+    path = str(tmp_path / "cache.json")
+    failing = {"fail": True}
+    ToolManifestCache(path).set(
+        FakeServer("a", failing), [cached_tool("a_cached")]
+    )
+
+    async def run():
+        bot = SlackMCPBot(
+            "xoxb-test",
+            "xapp-test",
+            [FakeServer("a", failing)],
+            None,
+            None,
+            tool_cache=ToolManifestCache(path),
+        )
+        try:
+            bot.load_cached_tools()
+            assert list(bot.tool_servers) == ["a_cached"]
+
+            await bot.initialize_servers()
+            assert bot.tools == []
+            assert bot.tool_servers == {}
+        finally:
+            await bot.socket_mode_handler.close_async()
+
+    asyncio.run(run())
+
+
+def test_stop_cancels_a_server_that_is_still_starting():
+    async def run():
+        server = HungServer("hung", {})
+        server.start()
+        await asyncio.sleep(0)
+
+        await asyncio.wait_for(server.stop(), 1)
+
+        assert server._task.cancelled()
+        assert server.cleaned_up
+        assert not await server.wait_ready(0)
+
+    asyncio.run(run())
+
+
+def test_stop_closes_a_running_server():
+    async def run():
+        server = FakeServer("a", {})
+        server.start()
+        assert await server.wait_ready(1)
+
+        await server.stop()
+
+        assert server.session is None
+        assert server._task.done()
+
+    asyncio.run(run())
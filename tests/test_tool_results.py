@@ -0,0 +1,74 @@
+from mcp.types import (
+    CallToolResult,
+    EmbeddedResource,
+    ImageContent,
+    TextContent,
+    TextResourceContents,
+)
+
+from mcp_simple_slackbot.main import ToolResultProcessor
+
+
+def text_result(*texts, is_error=False):
+    return CallToolResult(
+        content=[TextContent(type="text", text=text) for text in texts],
+        isError=is_error,
+    )
+
+
+def test_extract_text_joins_text_content():
+    result = text_result("first", "second")
+    assert ToolResultProcessor.extract_text(result) == "first\nsecond"
+
+
+def test_extract_text_reads_embedded_resources_and_labels_binary_content():
+    result = CallToolResult(
+        content=[
+            EmbeddedResource(
+                type="resource",
+                resource=TextResourceContents(
+                    uri="file:///report.txt", text="report body"
+                ),
+            ),
+            ImageContent(type="image", data="aGVsbG8=", mimeType="image/png"),
+        ]
+    )
+    assert ToolResultProcessor.extract_text(result) == (
+        "report body\n[image content]"
+    )
+
+
+def test_extract_text_handles_plain_values():
+    assert ToolResultProcessor.extract_text({"a": 1}) == '{\n  "a": 1\n}'
+    assert ToolResultProcessor.extract_text(42) == "42"
+
+
+def test_small_result_is_passed_through():
+    processed = ToolResultProcessor(100).process("search", text_result("found"))
+    assert processed.preview == "found"
+    assert not processed.truncated
+    assert not processed.is_error
+
+
+def test_large_result_is_truncated():
+    processed = ToolResultProcessor(10).process("search", text_result("x" * 50))
+    assert processed.truncated
+    assert processed.text == "x" * 50
+    assert processed.preview.startswith("x" * 10 + "\n")
+    assert "showing 10 of 50 characters" in processed.preview
+    assert processed.size_bytes == 50
+
+
+def test_error_result_is_marked():
+    processed = ToolResultProcessor(100).process(
+        "search", text_result("quota exceeded", is_error=True)
+    )
+    assert processed.is_error
+    assert processed.preview == (
+        f"{ToolResultProcessor.ERROR_MARKER}\nquota exceeded"
+    )
+
+
+def test_extract_text_falls_back_to_structured_content():
+    result = CallToolResult(content=[], structuredContent={"rows": 2})
+    assert ToolResultProcessor.extract_text(result) == '{\n  "rows": 2\n}'